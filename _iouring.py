@@ -0,0 +1,106 @@
+import os
+from typing import Any
+
+import _statx
+
+try:
+    import liburing  # type: ignore
+    _HAS_IOURING: bool = True
+except ImportError:
+    _HAS_IOURING = False
+
+
+BATCH_THRESHOLD: int = 256
+QUEUE_DEPTH: int = 4096
+
+
+def available() -> bool:
+    """Returns whether the optional `liburing` binding is installed."""
+    return _HAS_IOURING
+
+
+def batch_stat(
+    dir_fd: int,
+    names: list[str],
+    mask: int = _statx.STATX_BASIC_STATS,
+    flags: int = _statx.AT_STATX_DONT_SYNC
+) -> list[_statx.StatxResult | None] | None:
+    """
+    Stats every name in a directory through io_uring, submitting up to
+    `QUEUE_DEPTH` statx requests per `io_uring_enter` call.
+
+    Written against the `liburing` package's `Ring`/`Cqe`/`Statx` API
+    (see `reuirements.txt` for the supported version).
+
+    Args:
+        dir_fd (int): An open descriptor for the directory the names
+            are in. It is not closed.
+        names (list[str]): The entry names to stat.
+        mask (int): The `STATX_*` fields to request.
+        flags (int): The `AT_*` flags to pass.
+
+    Returns:
+        list[StatxResult | None] | None: The results in the same order
+            as `names`, with None for any entry that could not be
+            statted. None overall if io_uring could not be used, in
+            which case the caller should stat each entry itself.
+    """
+    if not _HAS_IOURING:
+        return None
+
+    results: list[_statx.StatxResult | None] = [None] * len(names)
+    ring: Any = None
+    initialised: bool = False
+
+    try:
+        ring = liburing.Ring()
+        cqe: Any = liburing.Cqe()
+        liburing.io_uring_queue_init(min(QUEUE_DEPTH, len(names)) or 1, ring)
+        initialised = True
+
+        for start in range(0, len(names), QUEUE_DEPTH):
+            chunk: list[str] = names[start:start + QUEUE_DEPTH]
+            # The buffers must outlive the submission.
+            buffers: list[Any] = [liburing.Statx() for _ in chunk]
+
+            for i, name in enumerate(chunk):
+                sqe: Any = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_statx(
+                    sqe, buffers[i], name, flags, mask, dir_fd
+                )
+                liburing.io_uring_sqe_set_data64(sqe, i)
+
+            liburing.io_uring_submit_and_wait(ring, len(chunk))
+
+            for _ in chunk:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry: Any = cqe[0]
+                index: int = liburing.io_uring_cqe_get_data64(entry)
+
+                # `res` raises the matching OSError for a failed request.
+                try:
+                    entry.res
+                    failed: bool = False
+                except OSError:
+                    failed = True
+                liburing.io_uring_cqe_seen(ring, entry)
+
+                if failed:
+                    continue
+
+                buf: Any = buffers[index]
+                results[start + index] = _statx.StatxResult(
+                    st_mode=buf.mode,
+                    st_uid=buf.uid,
+                    st_size=buf.size,
+                    st_mtime=buf.mtime,
+                )
+
+    except Exception:
+        return None
+
+    finally:
+        if initialised:
+            liburing.io_uring_queue_exit(ring)
+
+    return results
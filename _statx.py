@@ -0,0 +1,149 @@
+import ctypes
+import errno
+from functools import cache
+import os
+from typing import NamedTuple
+
+from utils import platform
+
+
+AT_FDCWD: int = -100
+AT_SYMLINK_NOFOLLOW: int = 0x100
+AT_STATX_DONT_SYNC: int = 0x4000
+
+STATX_TYPE: int = 0x1
+STATX_MODE: int = 0x2
+STATX_UID: int = 0x8
+STATX_MTIME: int = 0x40
+STATX_SIZE: int = 0x200
+STATX_BASIC_STATS: int = 0x7ff
+
+# Errors meaning statx itself can't be used, rather than the path being bad.
+UNSUPPORTED_ERRNOS: tuple[int, ...] = (errno.ENOSYS, errno.EPERM)
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """`struct statx`, up to `stx_mtime`. The rest is kept as padding."""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("_reserved", ctypes.c_char * 128),
+    ]
+
+
+class StatxResult(NamedTuple):
+    """
+    The fields of `struct statx` that Elysium reads. Named like
+    `os.stat_result` so either can be used by the metadata code.
+    """
+    st_mode: int
+    st_uid: int
+    st_size: int
+    st_mtime: float
+
+
+@cache
+def _libc_statx():
+    """Returns the libc `statx` function, or None if there isn't one."""
+    if platform() != "linux":
+        return None
+
+    try:
+        func = ctypes.CDLL("libc.so.6", use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+@cache
+def available() -> bool:
+    """
+    Returns whether `statx` can be used on this system. It needs glibc
+    2.28+ and a 4.11+ kernel, and may be blocked by a seccomp filter
+    (ENOSYS or EPERM), so it is probed once and the answer cached.
+    """
+    func = _libc_statx()
+    if func is None:
+        return False
+
+    buf: _Statx = _Statx()
+    return func(AT_FDCWD, b"/", 0, STATX_TYPE, ctypes.byref(buf)) == 0
+
+
+def from_buffer(buf: _Statx) -> StatxResult:
+    """Converts a filled `struct statx` into a `StatxResult`."""
+    return StatxResult(
+        st_mode=buf.stx_mode,
+        st_uid=buf.stx_uid,
+        st_size=buf.stx_size,
+        st_mtime=buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec / 1e9,
+    )
+
+
+def stat(
+    path: str,
+    mask: int = STATX_BASIC_STATS,
+    flags: int = 0,
+    dir_fd: int = AT_FDCWD
+) -> StatxResult:
+    """
+    Stats `path` using `statx`. Only call this when `available()`.
+
+    Args:
+        path (str): The path to stat, relative to `dir_fd`.
+        mask (int): The `STATX_*` fields to request.
+        flags (int): The `AT_*` flags to pass.
+        dir_fd (int): The directory `path` is relative to.
+
+    Raises:
+        OSError: When the call fails, with the matching subclass
+            (e.g. FileNotFoundError) for the errno.
+
+    Returns:
+        StatxResult: The requested fields.
+    """
+    buf: _Statx = _Statx()
+    result: int = _libc_statx()(
+        dir_fd,
+        os.fsencode(path),
+        flags,
+        mask,
+        ctypes.byref(buf)
+    )
+
+    if result != 0:
+        err: int = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+
+    return from_buffer(buf)
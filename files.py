@@ -1,49 +1,78 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from datetime import datetime
-from functools import cache
+from functools import lru_cache
 import json
 import os
 import re
-from typing import Any, Union
+import stat
+import time
+from typing import (
+    Any, Callable, ClassVar, Final, Iterable, Iterator, NamedTuple, Union
+)
 import psutil
 
+import _iouring
+import _statx
 import errors
 from utils import platform
 
-if platform() == "windows":
+_IS_WINDOWS: Final[bool] = platform() == "windows"
+_SEP: Final[str] = '\\' if _IS_WINDOWS else '/'
+
+if _IS_WINDOWS:
     import win32security
 else:
     import pwd
 
 
+_WIN_DRIVE_RE: re.Pattern[str] = re.compile(r"(?<=:)(?!\\)")
+
+_UNITS: Final[tuple[str, ...]] = (
+    "B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB"
+)
+
+_sid_cache: dict[str, str] = {}
+
+_NETWORK_FSTYPES: Final[frozenset[str]] = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "ceph", "afs",
+    "lustre", "glusterfs", "fuse.glusterfs", "fuse.sshfs",
+})
+
+_DRIVES_TTL: Final[float] = 2.0
+_drives_cache: tuple[float, list[Path], tuple[str, ...]] | None = None
+
 
 class Path:
-    def __init__(self, path: str | list[str] | None = None) -> None:
-        path = path or ""
-        self._separator: str = '\\' if platform() == "windows" else '/'
-        if isinstance(path, list):
-            while '' in path:
-                path.remove('')
-            path = self._separator.join(path)
-
-            if path.startswith(self.separator+self.separator):
-                path = path[1:]
-        
-        self._path: str = path
+    __slots__ = ("_path",)
+
+    _separator: ClassVar[str] = _SEP
+
+    def __init__(self, path: str | None = None) -> None:
+        self._path: str = path or ""
+
+    @classmethod
+    def from_parts(cls, parts: Iterable[str]) -> Path:
+        """Builds a path by joining the non-empty `parts` with the separator."""
+        path: str = cls._separator.join(filter(None, parts))
+
+        if path.startswith(cls._separator+cls._separator):
+            path = path[1:]
+
+        return cls(path)
 
     def to_dict(self) -> dict[str, str]:
         return {"path": self.path}
     
     def as_list(self) -> list[str]:
         list_version: list[str] = [
-            x.strip() 
-            for x in self.path.split(self._separator)
+            part
+            for part in (x.strip() for x in self._path.split(self._separator))
+            if part
         ]
-        while '' in list_version:
-            list_version.remove('')
 
-        if self.path.startswith(self.separator):
-            list_version.insert(0, self.separator)
+        if self._path.startswith(self._separator):
+            list_version.insert(0, self._separator)
         return list_version
     
     def startswith(self, other: Path | str) -> bool:
@@ -52,23 +81,26 @@ class Path:
     def endswith(self, other: Path | str) -> bool:
         return self.path.endswith(str(other))
 
+    def _stat(self) -> os.stat_result | None:
+        """Stats the path, or returns None if it can't be statted."""
+        try:
+            return os.stat(self._path)
+        except (OSError, ValueError):
+            return None
+
     def valid_dir(self) -> bool:
-        if not os.path.isdir(self.path) and self.path not in (
-            '',
-            self.separator
-        ):
-            return False
-        
-        return True
+        if self._path in ('', self._separator):
+            return True
+
+        file_stats: os.stat_result | None = self._stat()
+        return file_stats is not None and stat.S_ISDIR(file_stats.st_mode)
     
     def valid_file(self) -> bool:
-        if not os.path.isfile(self.path) and self.path not in (
-            '',
-            self.separator
-        ):
-            return False
-        
-        return True
+        if self._path in ('', self._separator):
+            return True
+
+        file_stats: os.stat_result | None = self._stat()
+        return file_stats is not None and stat.S_ISREG(file_stats.st_mode)
     
     def list_items(self) -> tuple[Path, ...]:
         if self.path == '':
@@ -83,6 +115,19 @@ class Path:
         items: list[str] = self.path.split(sep)
 
         return tuple(Path(item) for item in items)
+
+    def isplit(self, sep: str) -> Iterator[Path]:
+        """Like `split`, but yields each part lazily."""
+        start: int = 0
+        while (end := self._path.find(sep, start)) != -1:
+            yield Path(self._path[start:end])
+            start = end + len(sep)
+
+        yield Path(self._path[start:])
+
+    def nparts(self, sep: str) -> int:
+        """The number of parts `split` would give, without splitting."""
+        return self._path.count(sep) + 1
     
     @property
     def separator(self) -> str:
@@ -103,10 +148,12 @@ class Path:
         return str(self.path)
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Path):
-            return self.path == other.path
+            return self._path == other._path
         if isinstance(other, str):
-            return self.path == other
+            return self._path == other
         
         errors.warn(
             None,
@@ -116,10 +163,12 @@ class Path:
         return False
     
     def __ne__(self, other: object) -> bool:
+        if self is other:
+            return False
         if isinstance(other, Path):
-            return self.path != other.path
+            return self._path != other._path
         if isinstance(other, str):
-            return self.path != other
+            return self._path != other
         
         errors.warn(
             None,
@@ -134,36 +183,66 @@ class Path:
     def __add__(self, other: Path | str) -> Path:
         other_path: str = str(other)
         
-        return Path([self.path, other_path])
+        return Path.from_parts((self._path, other_path))
     
     def __radd__(self, other: Path | str) -> Path:
         other_path: str = str(other)
         
-        return Path([other_path, self.path])
+        return Path.from_parts((other_path, self._path))
     
     def __contains__(self, item: str) -> bool:
-        return item in self.as_list()
+        # Same answer as `item in self.as_list()`, without building it.
+        sep: str = self._separator
+        if item == sep:
+            return self._path.startswith(sep)
+
+        return bool(item) and any(
+            part.strip() == item for part in self._path.split(sep)
+        )
     
     def __len__(self) -> int:
-        return len(self.as_list())
+        # Same answer as `len(self.as_list())`, without building it.
+        sep: str = self._separator
+        length: int = sum(
+            1 for part in self._path.split(sep) if part and not part.isspace()
+        )
+
+        return length + 1 if self._path.startswith(sep) else length
         
     def __lt__(self, other: Path) -> bool:
-        return self.path.lower() < other.path.lower()
+        return self._path.casefold() < other._path.casefold()
     
     def __gt__(self, other: Path) -> bool:
-        return self.path.lower() > other.path.lower()
+        return self._path.casefold() > other._path.casefold()
     
     def __lte__(self, other: Path) -> bool:
-        return self.path.lower() <= other.path.lower()
+        return self._path.casefold() <= other._path.casefold()
     
     def __gte__(self, other: Path) -> bool:
-        return self.path.lower() >= other.path.lower()
+        return self._path.casefold() >= other._path.casefold()
 
     def __fspath__(self) -> str:
         return str(self.path)
     
     def __hash__(self) -> int:
-        return hash(self.path)
+        return hash(self._path)
+
+
+class ItemStats(NamedTuple):
+    """The name, stat result and type of a single directory entry."""
+    name: Path
+    stats: os.stat_result | _statx.StatxResult | None
+    is_dir: bool
+
+
+def _path_sort_key(path: Path) -> str:
+    """Sorts paths case-insensitively, the same order as `Path.__lt__`."""
+    return path._path.casefold()
+
+
+def _item_sort_key(item: ItemStats) -> str:
+    """Sorts `ItemStats` by name, like `_path_sort_key`."""
+    return item.name._path.casefold()
 
 
 class PathEncoder(json.JSONEncoder):
@@ -178,8 +257,49 @@ class PathEncoder(json.JSONEncoder):
 
 
 def get_drives() -> list[Path]:
-    """Returns the path of all drives mounted on the current system."""
-    return [Path(x.mountpoint) for x in psutil.disk_partitions(all=True)]
+    """
+    Returns the path of all drives mounted on the current system.
+
+    The result is cached for `_DRIVES_TTL` seconds, as listing the
+    partitions is slow and the root view is re-rendered often. Use
+    `invalidate_drives_cache` to force a refresh.
+    """
+    return list(_read_partitions()[0])
+
+
+def _read_partitions() -> tuple[list[Path], tuple[str, ...]]:
+    """
+    Returns the mounted drives and the mount points of those on network
+    filesystems, refreshing them at most every `_DRIVES_TTL` seconds.
+    """
+    global _drives_cache
+
+    now: float = time.monotonic()
+    if _drives_cache is not None and now - _drives_cache[0] < _DRIVES_TTL:
+        return (_drives_cache[1], _drives_cache[2])
+
+    partitions: list[Any] = psutil.disk_partitions(all=True)
+    drives: list[Path] = [Path(x.mountpoint) for x in partitions]
+    network_mounts: tuple[str, ...] = tuple(
+        x.mountpoint for x in partitions if x.fstype in _NETWORK_FSTYPES
+    )
+    _drives_cache = (now, drives, network_mounts)
+
+    return (drives, network_mounts)
+
+
+def _on_network_fs(file_path: str) -> bool:
+    """Returns whether `file_path` is on a network filesystem mount."""
+    return any(
+        file_path == mount or file_path.startswith(mount.rstrip(_SEP) + _SEP)
+        for mount in _read_partitions()[1]
+    )
+
+
+def invalidate_drives_cache() -> None:
+    """Clears the cached drives, e.g. after a drive is (un)mounted."""
+    global _drives_cache
+    _drives_cache = None
 
 
 def get_folders(directory: Path) -> list[Path]:
@@ -205,13 +325,11 @@ def get_folders(directory: Path) -> list[Path]:
             f"{repr(directory)} is not a valid directory.")
         return []
     
-    folders: list[Path] = []
-    for item in directory.list_items():
-        split_item: tuple[Path, ...] = item.split('.')
-        if len(split_item) <= 1 or item.startswith('.'):
-            folders.append(directory + item)
-    
-    return folders
+    return [
+        directory + Path(name)
+        for name, _, is_dir in _scan(directory)
+        if is_dir
+    ]
 
 
 def get_files_folders(file_path: Path) -> tuple[list[Path], list[Path]]:
@@ -235,39 +353,223 @@ def get_files_folders(file_path: Path) -> tuple[list[Path], list[Path]]:
         )
 
 
-    items: tuple[Path, ...] = file_path.list_items()
+    if file_path == '':
+        return ([], sorted(get_drives(), key=_path_sort_key))
 
     files: list[Path] = []
     folders: list[Path] = []
 
-    for item in items:
-        full_path: Path = file_path + item
-        if os.path.isfile(full_path):
-            files.append(item)
+    for name, is_file, _ in _scan(file_path):
+        if is_file:
+            files.append(Path(name))
             continue
-            
-        folders.append(item)
 
-    return (sorted(files), sorted(folders))
+        folders.append(Path(name))
+
+    return (
+        sorted(files, key=_path_sort_key),
+        sorted(folders, key=_path_sort_key)
+    )
+
+
+def get_files_folders_stats(
+    file_path: Path
+) -> tuple[list[ItemStats], list[ItemStats]]:
+    """
+    Gets all the files and folders in a given directory, along with the
+    stat result of each one.
+
+    The stat results can be passed on to `get_file_metadata` so that
+    each entry is only statted once. Drives, and entries that can't be
+    statted (e.g. broken symlinks), have a stat result of None; the
+    latter are listed as folders, like `get_files_folders` does. Large
+    directories are statted in one batch through io_uring when the
+    optional `liburing` package is installed.
+
+    Args:
+        file_path (Path): The directory to check.
+
+    Returns:
+        tuple[list[ItemStats], list[ItemStats]]: A tuple containing two
+            lists in the format (FILES, FOLDERS), both sorted by name.
+    """
+    if not file_path.valid_dir():
+        errors.error(
+            None,
+            "Not a directory",
+            "File path expects a directory. "
+            + f"{repr(file_path)} is not a directory."
+        )
+
+    if file_path == '':
+        return ([], sorted(
+            (ItemStats(drive, None, True) for drive in get_drives()),
+            key=_item_sort_key
+        ))
+
+    files: list[ItemStats] = []
+    folders: list[ItemStats] = []
+
+    dir_fd: int | None
+    it: Iterator[os.DirEntry[str]]
+    with _scandir(file_path) as (dir_fd, it):
+        entries: list[os.DirEntry[str]] = list(it)
+
+        batch: list[_statx.StatxResult | None] | None = None
+        if (
+            dir_fd is not None
+            and len(entries) >= _iouring.BATCH_THRESHOLD
+            and _iouring.available()
+        ):
+            batch = _iouring.batch_stat(
+                dir_fd,
+                [entry.name for entry in entries],
+                mask=(
+                    _statx.STATX_TYPE
+                    | _statx.STATX_MTIME
+                    | _statx.STATX_SIZE
+                    | _statx.STATX_UID
+                )
+            )
+
+        # DirEntry.stat() is relative to dir_fd, so it must run before
+        # the directory is closed.
+        for i, entry in enumerate(entries):
+            file_stats: os.stat_result | _statx.StatxResult | None = (
+                batch[i] if batch is not None else None
+            )
+            if file_stats is None:
+                # A broken symlink, or an entry removed since the scan,
+                # only loses its own stats rather than the whole listing.
+                try:
+                    file_stats = entry.stat()
+                except OSError:
+                    file_stats = None
+
+            item: ItemStats = ItemStats(
+                Path(entry.name),
+                file_stats,
+                file_stats is not None and stat.S_ISDIR(file_stats.st_mode)
+            )
+
+            if file_stats is not None and stat.S_ISREG(file_stats.st_mode):
+                files.append(item)
+                continue
 
+            folders.append(item)
+
+    return (
+        sorted(files, key=_item_sort_key),
+        sorted(folders, key=_item_sort_key)
+    )
+
+
+def _scan(file_path: Path) -> Iterator[tuple[str, bool, bool]]:
+    """
+    Yields the name and type of every entry in a directory.
+
+    The file type comes from the directory read itself, so no extra
+    `stat` call is needed per entry (except for symlinks, which are
+    followed to match `os.path.isfile`).
+
+    Args:
+        file_path (Path): The directory to scan.
+
+    Yields:
+        tuple[str, bool, bool]: The entry name, whether it is a file,
+            and whether it is a directory.
+    """
+    it: Iterator[os.DirEntry[str]]
+    with _scandir(file_path) as (_, it):
+        for entry in it:
+            yield (entry.name, entry.is_file(), entry.is_dir())
+
+
+@contextmanager
+def _scandir(
+    file_path: Path
+) -> Iterator[tuple[int | None, Iterator[os.DirEntry[str]]]]:
+    """
+    Opens a directory for scanning.
+
+    Where supported, the directory is opened once as a file descriptor
+    and scanned through it, so stats on its entries are made relative
+    to that descriptor instead of walking the full path again. On
+    Windows, the path is scanned directly.
+
+    Args:
+        file_path (Path): The directory to scan.
 
-def get_file_metadata(file_path: Path) -> dict[str, Union[Path, str, datetime, None]]:
+    Yields:
+        tuple[int | None, Iterator[os.DirEntry[str]]]: The directory's
+            file descriptor (None when scanning by path) and its entries.
+    """
+    if _IS_WINDOWS or os.scandir not in os.supports_fd:
+        with os.scandir(str(file_path)) as it:
+            yield (None, it)
+        return
+
+    dir_fd: int = os.open(
+        str(file_path),
+        os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+    )
+    try:
+        with os.scandir(dir_fd) as it:
+            yield (dir_fd, it)
+    finally:
+        os.close(dir_fd)
+
+
+def get_file_metadata(
+    file_path: Path,
+    file_stats: os.stat_result | _statx.StatxResult | None = None,
+    is_dir: bool | None = None
+) -> dict[str, Union[Path, str, datetime, None]]:
     """
     Retrieve metadata for a single file or folder.
 
     Args:
         file_path (str): Path to the file or folder.
+        file_stats (os.stat_result | StatxResult | None): The stat
+            result for the item, if already known (e.g. from
+            `get_files_folders_stats`). The item is only statted when
+            this is not given, using `statx` for network mounts on
+            Linux where available.
+        is_dir (bool | None): Whether the item is a directory, if
+            already known. Otherwise it is taken from `file_stats`.
 
     Returns:
         dict: Metadata dictionary containing owner, last modified time, and file size.
     """
     try:
-        file_stats: os.stat_result = os.stat(file_path)
-        owner: str = (
-            _get_windows_owner(file_path) 
-            if platform() == "windows" 
-            else _get_unix_owner(file_stats)
-        )
+        # statx through ctypes is ~3-4x slower than os.stat on a local
+        # disk; it only pays off on network mounts, where
+        # AT_STATX_DONT_SYNC lets the kernel skip a server round trip.
+        if (
+            file_stats is None
+            and _statx.available()
+            and _on_network_fs(str(file_path))
+        ):
+            try:
+                file_stats = _statx.stat(
+                    str(file_path),
+                    mask=(
+                        _statx.STATX_TYPE
+                        | _statx.STATX_MTIME
+                        | _statx.STATX_SIZE
+                        | _statx.STATX_UID
+                    ),
+                    flags=_statx.AT_STATX_DONT_SYNC
+                )
+            except OSError as e:
+                if e.errno not in _statx.UNSUPPORTED_ERRNOS:
+                    raise
+        if file_stats is None:
+            file_stats = os.stat(file_path)
+        if is_dir is None:
+            is_dir = stat.S_ISDIR(file_stats.st_mode)
+
+        owner: str = _get_owner(file_path, file_stats)
 
         
 
@@ -277,10 +579,10 @@ def get_file_metadata(file_path: Path) -> dict[str, Union[Path, str, datetime, N
             "Last Modified": datetime.fromtimestamp(file_stats.st_mtime),
             "File Size": (
                 format_size(file_stats.st_size) 
-                if not os.path.isdir(file_path) 
+                if not is_dir 
                 else None
             ),
-            "Item": get_file_type(file_path),
+            "Item": get_file_type(file_path, is_dir=is_dir),
         }
 
         return metadata
@@ -290,7 +592,7 @@ def get_file_metadata(file_path: Path) -> dict[str, Union[Path, str, datetime, N
     
     except Exception as e:
         return {"Error": str(e)}
-    
+
 
 def format_size(size: int | float) -> str:
     """
@@ -302,44 +604,39 @@ def format_size(size: int | float) -> str:
     Returns:
         str: The file size as a formatted string.
     """
-    units: list[str] = ["B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB"]
-    for unit in units:
-        if size < 1024:
-            return f"{size:.2f} {unit}"
-        size /= 1024
-    return f"{size:.2f} {units[-1]}"
+    if size < 1024:
+        return f"{size:.2f} B"
+
+    # Each unit is 2**10 times the last, so the unit index is the
+    # number of whole 10-bit groups above the first.
+    index: int = min((int(size).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size / (1 << (index * 10)):.2f} {_UNITS[index]}"
 
 
 def fix_path(path: Path) -> Path:
-    is_windows: bool = platform() == "windows"
+    fixed: str = str(path)
 
-    if is_windows:
-        path = Path(re.sub(r"(?<=:)(?!\\)", r"\\", str(path)))
-        
-    elif not path.startswith('/') and str(path) not in ['', '/']:
-        path = Path('/') + path
+    if _IS_WINDOWS:
+        if ':' in fixed:
+            fixed = _WIN_DRIVE_RE.sub(r"\\", fixed)
 
+    elif fixed and not fixed.startswith('/'):
+        fixed = '/' + fixed
 
-    if not path.valid_dir():
+
+    if not os.path.isdir(fixed) and fixed not in ('', path.separator):
         errors.error(
             None,
             "Not a directory",
-            f"fix_path expects a directory! {repr(path)} does not match!"
+            f"fix_path expects a directory! {repr(fixed)} does not match!"
         )
 
-    if is_windows and not path.endswith('\\') and path != '':
-        path += Path('\\')
-    if (
-        not is_windows
-        and not path.endswith('/')
-        and str(path) not in ['/', '']
-    ):
-        path = path + Path('/')
-
-    if str(path) not in ('', '/', '\\'):
-        path = Path(os.path.realpath(path))
+    # realpath drops any trailing separator, so there is no need to add
+    # one first.
+    if fixed not in ('', '/', '\\'):
+        fixed = os.path.realpath(fixed)
 
-    return path
+    return Path(fixed)
 
 
 def _get_windows_owner(file_path: Path) -> str:
@@ -357,17 +654,26 @@ def _get_windows_owner(file_path: Path) -> str:
         )
         owner_sid = security_descriptor.GetSecurityDescriptorOwner()
 
+        # Most files in a folder share an owner, and the SID lookup can
+        # go over the network, so names are cached by SID.
+        sid_string: str = win32security.ConvertSidToStringSid( #type: ignore
+            owner_sid
+        )
+        if sid_string in _sid_cache:
+            return _sid_cache[sid_string]
+
         owner, _,  _ =   win32security.LookupAccountSid( #type: ignore
             None, #type: ignore
             owner_sid
         )  
+        _sid_cache[sid_string] = owner
         return owner
     except Exception as e:
         print(e)
         return "Unknown Owner"
     
 
-def _get_unix_owner(file_stats: os.stat_result) -> str:
+def _get_unix_owner(file_stats: os.stat_result | _statx.StatxResult) -> str:
         """Get the owner of a file or folder on Unix-like systems."""
         try:
             return pwd.getpwuid(file_stats.st_uid).pw_name #type: ignore
@@ -375,11 +681,59 @@ def _get_unix_owner(file_stats: os.stat_result) -> str:
             return "Unknown Owner"
 
 
-@cache
-def get_file_type(file_path: Path) -> str:
+def _get_windows_owner_from_path(
+    file_path: Path,
+    file_stats: os.stat_result | _statx.StatxResult
+) -> str:
+    """`_get_owner` for Windows, which needs the path, not the stats."""
+    return _get_windows_owner(file_path)
+
+
+def _get_unix_owner_from_stat(
+    file_path: Path,
+    file_stats: os.stat_result | _statx.StatxResult
+) -> str:
+    """`_get_owner` for Unix-like systems, which only needs the stats."""
+    return _get_unix_owner(file_stats)
+
+
+# Picked once here so reading metadata doesn't branch on the platform.
+_get_owner: Callable[
+    [Path, os.stat_result | _statx.StatxResult], str
+] = (
+    _get_windows_owner_from_path
+    if _IS_WINDOWS
+    else _get_unix_owner_from_stat
+)
+
+
+@lru_cache(maxsize=4096)
+def get_file_type(file_path: Path, *, is_dir: bool | None = None) -> str:
+    """
+    Returns the extension of a file, or "Folder" for a directory.
+
+    Args:
+        file_path (Path): The file or folder.
+        is_dir (bool | None): Whether the item is a directory, if known
+            (e.g. from a stat result). When not given, an item with no
+            extension is assumed to be a folder.
+
+    Returns:
+        str: The extension, "Folder", or "File" for a known file with
+            no extension.
+    """
+    if is_dir:
+        return "Folder"
+
     extension: str
     _, extension = os.path.splitext(file_path)
 
-    if not extension: extension = "Folder"
+    if not extension:
+        extension = "File" if is_dir is False else "Folder"
+
+    return extension
+
 
-    return extension
\ No newline at end of file
+def clear_file_type_cache() -> None:
+    """Clears the cached file types, e.g. after a directory changes."""
+    get_file_type.cache_clear()
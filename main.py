@@ -8,6 +8,7 @@ import shutil
 from PIL import Image, ImageTk #type: ignore - This is needed on Linux, but not Win32
 import subprocess
 import threading
+import time
 from typing import Any, Callable
 import sys
 
@@ -22,6 +23,10 @@ import settings
 import utils
 
 
+# How long the stats gathered while listing a folder are trusted for the
+# details bar. After that, a click stats the item again.
+LISTING_STATS_TTL: float = 2.0
+
 
 def setup_parser(arguments: list[str], version: str) -> argparse.Namespace:
     """
@@ -121,11 +126,18 @@ def get_settings(file_path: Path) -> settings.Settings:
 def fetch_metadata(
     app: gui.App,
     file_path: str,
-    callback: Callable[[gui.App, dict[str, str | Path | files.datetime | None]], Any]
+    callback: Callable[[gui.App, dict[str, str | Path | files.datetime | None]], Any],
+    item_stats: files.ItemStats | None = None
 ) -> None:
     def worker():
         metadata_dict: dict[str, str | Path| files.datetime | None] = (
-            files.get_file_metadata(Path(file_path))
+            files.get_file_metadata(
+                Path(file_path),
+                item_stats.stats,
+                item_stats.is_dir
+            )
+            if item_stats is not None
+            else files.get_file_metadata(Path(file_path))
         )
         callback(app, metadata_dict)
 
@@ -150,8 +162,21 @@ def display_details(button: gui.Button, app: gui.App) -> None:
     for widget in app.details_bar.widgets[:]:
         app.details_bar.remove_widget(widget)
     
+    # Reuse the stats from when the folder was listed, but only if it
+    # was just listed; otherwise the item may have been edited since.
+    listing: dict[str, Any] = (
+        app.extra_details["directories"].get(app.file_path, {})
+    )
+    listed_at: float | None = listing.get("listed_at")
+    item_stats: files.ItemStats | None = None
+    if (
+        listed_at is not None
+        and time.monotonic() - listed_at < LISTING_STATS_TTL
+    ):
+        item_stats = listing.get("stats", {}).get(Path(file_path))
+
     file_path = os.path.join(app.file_path, file_path)
-    fetch_metadata(app, file_path, _update_details_bar)
+    fetch_metadata(app, file_path, _update_details_bar, item_stats)
 
 
 def open_folder(button: gui.Button, app: gui.App) -> None:
@@ -222,12 +247,25 @@ def populate_files(app: gui.App, refresh: bool = False) -> None:
         folders = (
             app.extra_details["directories"][file_path]["folders"]
         )
+        # The items may have changed since this listing was made.
+        app.extra_details["directories"][file_path].pop("stats", None)
     
     else:
-        files_list, folders = files.get_files_folders(file_path)
+        file_items: list[files.ItemStats]
+        folder_items: list[files.ItemStats]
+        file_items, folder_items = files.get_files_folders_stats(file_path)
+        files_list = [item.name for item in file_items]
+        folders = [item.name for item in folder_items]
+
         app.extra_details["directories"][file_path] = {}
         app.extra_details["directories"][file_path]["folders"] = folders
         app.extra_details["directories"][file_path]["files"] = files_list
+        app.extra_details["directories"][file_path]["stats"] = {
+            item.name: item for item in file_items + folder_items
+        }
+        app.extra_details["directories"][file_path]["listed_at"] = (
+            time.monotonic()
+        )
 
 
     for _, folder in enumerate(folders):
@@ -378,7 +416,7 @@ def back_directory(app: gui.App) -> None:
     new_fp: Path
 
     if len(file_path) != 1:
-        new_fp = Path(file_path[:-1])
+        new_fp = Path.from_parts(file_path[:-1])
     elif (
         (file_path == ['/'] and utils.platform() != "windows")
         or utils.platform() == "windows"
@@ -536,7 +574,7 @@ def paste(app: gui.App) -> None:
     file_ending: Path
 
     path_as_list: list[str] = recent_copy.as_list()
-    directory = Path(path_as_list[:-1])
+    directory = Path.from_parts(path_as_list[:-1])
     file_ending = Path(path_as_list[-1])
 
     if recent_copy.valid_file():
@@ -615,12 +653,12 @@ async def main() -> None:
 
 
     if utils.platform() != "windows":
-        app.root.iconphoto(True, gui.tk.PhotoImage(str(Path(
+        app.root.iconphoto(True, gui.tk.PhotoImage(str(Path.from_parts(
             [str(app.root_dir), "Images", "ElysiumLogo.png"]
         ))))
     else:
         app.root.iconbitmap(
-            Path([str(app.root_dir), "Images", "ElysiumLogo.ico"]).path
+            Path.from_parts([str(app.root_dir), "Images", "ElysiumLogo.ico"]).path
         )
 
     if parser.directory is not None and os.path.isdir(parser.directory):
@@ -628,30 +666,30 @@ async def main() -> None:
 
     app.add_image(
         "logo",
-        Path([str(app.root_dir), "Images", "ElysiumLogo.png"]),
+        Path.from_parts([str(app.root_dir), "Images", "ElysiumLogo.png"]),
         size=(45, 45)
     )
     app.add_image(
         "new_file",
-        Path([str(app.root_dir), "Images", "light", "new_file.png"]),
-        Path([str(app.root_dir), "Images", "dark", "new_file.png"]),
+        Path.from_parts([str(app.root_dir), "Images", "light", "new_file.png"]),
+        Path.from_parts([str(app.root_dir), "Images", "dark", "new_file.png"]),
         size=(25, 25)
     )
     app.add_image(
         "settings",
-        Path([str(app.root_dir), "Images", "light", "settings.png"]),
-        Path([str(app.root_dir), "Images", "dark", "settings.png"]),
+        Path.from_parts([str(app.root_dir), "Images", "light", "settings.png"]),
+        Path.from_parts([str(app.root_dir), "Images", "dark", "settings.png"]),
         size=(25, 25)
     )
     app.add_image(
         "file",
-        Path([str(app.root_dir), "Images", "light", "file.png"]),
-        Path([str(app.root_dir), "Images", "dark", "file.png"])
+        Path.from_parts([str(app.root_dir), "Images", "light", "file.png"]),
+        Path.from_parts([str(app.root_dir), "Images", "dark", "file.png"])
     )
     app.add_image(
         "folder",
-        Path([str(app.root_dir), "Images", "light", "folder.png"]),
-        Path([str(app.root_dir), "Images", "dark", "folder.png"])
+        Path.from_parts([str(app.root_dir), "Images", "light", "folder.png"]),
+        Path.from_parts([str(app.root_dir), "Images", "dark", "folder.png"])
     )
 
     app.extra_details["directories"] = {
@@ -171,8 +171,10 @@ class Settings:
     
     @color_theme.setter
     def color_theme(self, value: Path | str | list[str]) -> None:
-        if isinstance(value, str) or isinstance(value, list):
+        if isinstance(value, str):
             value = Path(value)
+        elif isinstance(value, list):
+            value = Path.from_parts(value)
             
         if not value.valid_file():
             errors.warn(
@@ -190,8 +192,10 @@ class Settings:
     
     @start_directory.setter
     def start_directory(self, value: Path | str | list[str]) -> None:
-        if isinstance(value, str) or isinstance(value, list):
+        if isinstance(value, str):
             value = Path(value)
+        elif isinstance(value, list):
+            value = Path.from_parts(value)
 
         if not value.valid_dir():
             errors.warn(
@@ -211,8 +215,10 @@ class Settings:
     @recent_files.setter
     def recent_files(self, value: list[Path | str | list[str]]) -> None:
         for i, item in enumerate(value):
-            if isinstance(item, str) or isinstance(item, list):
+            if isinstance(item, str):
                 value[i] = Path(item)
+            elif isinstance(item, list):
+                value[i] = Path.from_parts(item)
 
         error: bool = False
 